@@ -15,20 +15,24 @@ All knobs are configurable via environment variables (see cheatsheet at bottom).
 """
 
 import os
-import re
 import time
+import atexit
+import asyncio
+import functools
 import json
 import random
 import signal
 import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
+from PIL import Image, ImageDraw
 from luma.core.interface.serial import spi, noop
 from luma.led_matrix.device import max7219
-from luma.core.render import canvas
 from luma.core.legacy import text as legacy_text, textsize
 from luma.core.legacy.font import proportional, TINY_FONT, SINCLAIR_FONT
 
@@ -61,33 +65,146 @@ def _parse_hhmm(s: str, fallback: tuple[int, int]) -> tuple[int, int]:
     except Exception:
         return fallback
 
-def _in_window(now: datetime, start_hm: tuple[int, int], end_hm: tuple[int, int]) -> bool:
-    """True if current time is within [start, end) minutes; handles windows crossing midnight."""
-    cur = now.hour * 60 + now.minute
-    s = start_hm[0] * 60 + start_hm[1]
-    e = end_hm[0] * 60 + end_hm[1]
+def _in_window_min(cur: int, s: int, e: int) -> bool:
+    """True if minute-of-day cur is within [s, e); handles windows crossing midnight."""
     if s <= e:
         return s <= cur < e            # normal window
     else:
         return cur >= s or cur < e     # crosses midnight
 
+def brightness_schedule(day_brt: int, night_brt: int,
+                        night_from: tuple[int, int], night_to: tuple[int, int]) -> bytes:
+    """Brightness for each minute of the day (1440 entries), values clamped to 0..255."""
+    day = max(0, min(255, day_brt))
+    night = max(0, min(255, night_brt))
+    s = night_from[0] * 60 + night_from[1]
+    e = night_to[0] * 60 + night_to[1]
+    return bytes(night if _in_window_min(m, s, e) else day for m in range(1440))
+
 def handle_signal(signum, frame):
     global stop
     stop = True
 
+# ------------------ Frame output & scheduling ------------------
+FRAME_PERIOD = 0.2
+
+# Every blocking device call (display/contrast) runs on this one thread, so SPI access stays serialized
+_SPI_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="led-spi")
+
+async def device_io(fn, *args):
+    """Run a blocking device call on the SPI thread without stalling the render loop."""
+    return await asyncio.get_running_loop().run_in_executor(_SPI_POOL, fn, *args)
+
+def submit_frame(frames: asyncio.Queue, image):
+    """Queue a finished frame for the SPI writer; a frame still waiting is dropped (latest wins)."""
+    if frames.full():
+        frames.get_nowait()
+    frames.put_nowait(image)
+
+@contextmanager
+def frame_canvas(device, frames: asyncio.Queue):
+    """Like luma's canvas(), but the finished image is queued for the SPI writer instead of displayed."""
+    image = Image.new(device.mode, device.size)
+    yield ImageDraw.Draw(image)
+    submit_frame(frames, image)
+
+async def spi_writer(device, frames: asyncio.Queue):
+    """Push queued frames to the device until a None sentinel arrives."""
+    while True:
+        image = await frames.get()
+        if image is None:
+            return
+        await device_io(device.display, image)
+
+async def run_display(device, render_loop):
+    """
+    Run render_loop(frames) alongside the SPI writer; SPI transfers overlap the next frame's drawing.
+    If either side fails, the other is stopped and the error is raised (so systemd can restart us).
+    """
+    frames = asyncio.Queue(maxsize=1)
+    writer = asyncio.create_task(spi_writer(device, frames))
+    renderer = asyncio.create_task(render_loop(frames))
+    await asyncio.wait({writer, renderer}, return_when=asyncio.FIRST_COMPLETED)
+
+    if writer.done():
+        # Device I/O failed (or the writer quit early): frames would pile up unseen
+        renderer.cancel()
+        await asyncio.gather(renderer, return_exceptions=True)
+        writer.result()
+        raise RuntimeError("SPI writer stopped unexpectedly")
+
+    submit_frame(frames, None)
+    await writer
+    renderer.result()
+
+async def sleep_to_next_tick(period: float = FRAME_PERIOD):
+    """
+    Sleep until the next wall-clock multiple of `period` (plus 1 ms).
+    Ticks stay phase-locked to real seconds, so there is no drift and no
+    lag behind second boundaries; overruns simply resume on the next tick.
+    """
+    await asyncio.sleep(period - (time.time() % period) + 0.001)
+
+async def sleep_to_next_change(width: int, seconds_bar: bool):
+    """
+    Clock face: sleep until it can next change, i.e. the next second boundary
+    (blink, minute, hour sparkle) or the next seconds-bar pixel, instead of
+    waking every FRAME_PERIOD. Never longer than 1 s, so periodic checks stay live.
+    """
+    now_ts = time.time()
+    delay = 1.0 - (now_ts % 1.0)
+    if seconds_bar:
+        sec = now_ts % 60.0
+        filled = int(sec / 60.0 * width)
+        delay = min(delay, (filled + 1) * 60.0 / width - sec)
+    await asyncio.sleep(max(0.01, delay) + 0.001)
+
 # ------------------ Sensors ------------------
+TEMP_CACHE_SEC = 2.0
+_temp_cache = {"t": 0.0, "v": None, "sysfs_ok": False}
+
+# Thermal zone kept open; each read is a single pread() instead of open/read/close
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+_thermal_fd = None
+
+def _close_thermal_fd():
+    global _thermal_fd
+    if _thermal_fd is not None:
+        try:
+            os.close(_thermal_fd)
+        except OSError:
+            pass
+        _thermal_fd = None
+
+atexit.register(_close_thermal_fd)
+
 def get_cpu_temp_c():
-    """Return CPU temperature in °C (float) or None if unavailable."""
+    """Return CPU temperature in °C (float) or None if unavailable (cached for TEMP_CACHE_SEC)."""
+    now_ts = time.monotonic()
+    if _temp_cache["t"] and now_ts - _temp_cache["t"] < TEMP_CACHE_SEC:
+        return _temp_cache["v"]
+    _temp_cache["t"] = now_ts
+    _temp_cache["v"] = _read_cpu_temp_c()
+    return _temp_cache["v"]
+
+def _read_cpu_temp_c():
+    global _thermal_fd
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-            return int(f.read().strip()) / 1000.0
+        if _thermal_fd is None:
+            _thermal_fd = os.open(THERMAL_PATH, os.O_RDONLY)
+        val = int(os.pread(_thermal_fd, 16, 0).strip()) / 1000.0
+        _temp_cache["sysfs_ok"] = True
+        return val
     except Exception:
-        pass
+        _close_thermal_fd()  # reopen on the next attempt
+    # sysfs worked before: treat this as a transient miss, don't spawn vcgencmd
+    if _temp_cache["sysfs_ok"]:
+        return None
     try:
+        # Output is always "temp=NN.N'C"
         out = subprocess.check_output(["vcgencmd", "measure_temp"], stderr=subprocess.DEVNULL).decode()
-        m = re.search(r"temp=([\d\.]+)", out)
-        if m:
-            return float(m.group(1))
+        if out.startswith("temp="):
+            return float(out[5:out.index("'")])
     except Exception:
         pass
     return None
@@ -138,6 +255,12 @@ def weather_worker(state: dict, lock: threading.Lock, provider: str,
             time.sleep(step)
             sleep_left -= step
 
+# ------------------ Text measurement ------------------
+@functools.lru_cache(maxsize=512)
+def _measure(text: str, font) -> tuple[int, int]:
+    """Cached legacy textsize(); fonts are long-lived, so identity is a safe key."""
+    return textsize(text, font=font)
+
 # ------------------ Tiny 3x5 font for temperature ------------------
 DIGITS_3x5 = {
     "0": ["111", "101", "101", "101", "111"],
@@ -154,6 +277,13 @@ DIGITS_3x5 = {
     "C": ["111", "100", "100", "100", "111"],
 }
 
+# Glyph rows as 3-bit ints, bit 0 = leftmost column, so a shifted glyph lands at its x offset
+DIGITS_3x5_BITS = {ch: tuple(int(row[::-1], 2) for row in rows) for ch, rows in DIGITS_3x5.items()}
+
+# "white" already resolved to ink for 1-bit canvases (skips PIL colour parsing)
+WHITE = 255
+
+@functools.lru_cache(maxsize=256)
 def small35_text_size(txt: str, spacing: int = 1):
     """Compute width/height of 3x5 text."""
     w = 0
@@ -166,18 +296,26 @@ def small35_text_size(txt: str, spacing: int = 1):
 
 def draw_small35(draw, x: int, y: int, txt: str, spacing: int = 1):
     """Draw 3x5 text at (x, y)."""
-    cx = x
+    # OR every glyph into one int per row (bit n = column x + n), then walk the set bits
+    words = [0] * 5
+    cx = 0
     for i, ch in enumerate(txt):
-        glyph = DIGITS_3x5.get(ch)
-        if not glyph:
+        glyph = DIGITS_3x5_BITS.get(ch)
+        if glyph is None:
             continue
-        for ry, row in enumerate(glyph):
-            for rx, bit in enumerate(row):
-                if bit == "1":
-                    draw.point((cx + rx, y + ry), fill="white")
+        for ry in range(5):
+            words[ry] |= glyph[ry] << cx
         cx += 3
         if i != len(txt) - 1:
             cx += spacing
+    pts = []
+    for ry, w in enumerate(words):
+        while w:
+            b = w & -w
+            pts.append((x + b.bit_length() - 1, y + ry))
+            w ^= b
+    if pts:
+        draw.point(pts, fill=WHITE)
 
 # ------------------ Time rendering with custom colon ------------------
 def draw_time_with_custom_colon(draw, device, timestr: str, font, blink: bool,
@@ -195,8 +333,8 @@ def draw_time_with_custom_colon(draw, device, timestr: str, font, blink: bool,
     else:
         hh, mm = "88", "88"
 
-    w_h, h = textsize(hh, font=font)
-    w_m, _ = textsize(mm, font=font)
+    w_h, h = _measure(hh, font)
+    w_m, _ = _measure(mm, font)
     w_time = w_h + gap + colon_w + gap + w_m
 
     # If not enough room, shrink reserved left area so time never shifts
@@ -219,12 +357,60 @@ def draw_time_with_custom_colon(draw, device, timestr: str, font, blink: bool,
     if not blink:
         t1 = y + max(0, (h - 1 - colon_vgap) // 2)
         t2 = min(y + h - 1, t1 + colon_vgap)
-        draw.point((cx, t1), fill="white")
-        draw.point((cx, t2), fill="white")
+        draw.point([(cx, t1), (cx, t2)], fill="white")
 
     # Minutes
     legacy_text(draw, (cx + colon_w + gap, y), mm, font=font, fill="white")
 
+@functools.lru_cache(maxsize=64)
+def _time_layout(timestr: str, font, colon_vgap: int, align: str, width: int, height: int):
+    """
+    Layout of draw_time_with_custom_colon() for the fixed gap=1, colon_w=1 case.
+    Right-aligned time ends at the right edge whatever left_reserved is, so it is not a parameter.
+    Returns (hh, mm, x0, y, w_h, t1, t2): hours at (x0, y), colon dots at rows t1/t2.
+    """
+    if ":" in timestr:
+        hh, mm = timestr.split(":", 1)
+    else:
+        hh, mm = "88", "88"
+    w_h, h = _measure(hh, font)
+    w_m, _ = _measure(mm, font)
+    w_time = w_h + 3 + w_m
+    x0 = max(0, (width - w_time) // 2) if align == "center" else max(0, width - w_time)
+    y = max(0, (height - h) // 2)
+    t1 = y + max(0, (h - 1 - colon_vgap) // 2)
+    t2 = min(y + h - 1, t1 + colon_vgap)
+    return hh, mm, x0, y, w_h, t1, t2
+
+def _draw_time_fast(draw, hh: str, mm: str, x0: int, y: int, w_h: int, t1: int, t2: int,
+                    font, blink: bool):
+    """draw_time_with_custom_colon() with the layout from _time_layout(); returns the colon dots."""
+    legacy_text(draw, (x0, y), hh, font=font, fill="white")
+    cx = x0 + w_h + 1
+    if not blink:
+        draw.point([(cx, t1), (cx, t2)], fill="white")
+    legacy_text(draw, (cx + 2, y), mm, font=font, fill="white")
+    return (cx, t1), (cx, t2)
+
+def render_clock_base(device, timestr: str, time_font, temp_txt: str | None,
+                      colon_vgap: int, align: str = "right"):
+    """
+    Rasterize the static part of a clock frame (temperature + HH:MM).
+    Returns (colon_on, colon_off) images; callers copy one and add the seconds bar.
+    """
+    image = Image.new(device.mode, device.size)
+    draw = ImageDraw.Draw(image)
+    if temp_txt:
+        y0 = (device.height - 5) // 2
+        draw_small35(draw, 0, y0, temp_txt, spacing=1)
+    layout = _time_layout(timestr, time_font, colon_vgap, align, device.width, device.height)
+    colon = _draw_time_fast(draw, *layout, time_font, False)
+    image_off = image.copy()
+    for cx, cy in colon:
+        if 0 <= cx < device.width and 0 <= cy < device.height:  # colon may be clipped off-screen
+            image_off.putpixel((cx, cy), 0)
+    return image, image_off
+
 # ------------------ ASCII English date ticker ------------------
 WD_EN = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 MO_EN = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
@@ -234,22 +420,28 @@ def format_en_date(dt: datetime, with_year: bool = True) -> str:
     base = f"{WD_EN[(dt.weekday()) % 7]} {dt.day:02d} {MO_EN[dt.month - 1]}"
     return f"{base} {dt.year}" if with_year else base
 
-def marquee_once_legacy(device, text_ascii: str, font, speed=0.07, gap=16):
+async def marquee_once_legacy(device, frames: asyncio.Queue, text_ascii: str, font,
+                              speed=0.07, gap=16):
     """Scroll ASCII string using legacy font."""
-    w, h = textsize(text_ascii, font=font)
+    w, h = _measure(text_ascii, font)
     total = device.width + w + gap
+    y = max(0, (device.height - h) // 2)
+
+    # Rasterize the string once; each step is just a paste at the new offset
+    text_img = Image.new(device.mode, (max(1, w), device.height))
+    legacy_text(ImageDraw.Draw(text_img), (0, y), text_ascii, font=font, fill="white")
+
     for offset in range(0, total, 1):  # 1 px step
         if stop:
             return
-        x = device.width - offset
-        y = max(0, (device.height - h) // 2)
-        with canvas(device) as draw:
-            legacy_text(draw, (x, y), text_ascii, font=font, fill="white")
-        time.sleep(speed)
+        frame = Image.new(device.mode, device.size)
+        frame.paste(text_img, (device.width - offset, 0))
+        submit_frame(frames, frame)
+        await asyncio.sleep(speed)
 
 
 def draw_center_text(draw, device, txt: str, font):
-    w, h = textsize(txt, font=font)
+    w, h = _measure(txt, font)
     x = max(0, (device.width - w) // 2)
     y = max(0, (device.height - h) // 2)
     legacy_text(draw, (x, y), txt, font=font, fill="white")
@@ -305,20 +497,19 @@ def get_uptime_short() -> str | None:
         return None
 
 
-def render_info_page(device, page: str, now: datetime, time_font, text_font, time_fmt: str,
-                     blink_colon: bool, colon_vgap: int, seconds_bar: bool,
-                     seconds_bar_dots: bool, temp_show_c: int, ticker_with_year: int,
-                     ticker_speed: float, ticker_gap: int):
+async def render_info_page(device, frames: asyncio.Queue, page: str, now: datetime,
+                           time_font, text_font, time_fmt: str,
+                           blink_colon: bool, colon_vgap: int, seconds_bar: bool,
+                           seconds_bar_dots: bool, temp_show_c: bool, ticker_with_year: bool,
+                           ticker_speed: float, ticker_gap: int):
     p = page.strip().lower()
 
     if p == "time":
         s = now.strftime(time_fmt)
-        blink = bool(blink_colon and (now.second % 2 == 1))
-        with canvas(device) as draw:
-            draw_time_with_custom_colon(draw, device, s, time_font, blink=blink,
-                                        left_reserved=0, gap=1, colon_w=1,
-                                        colon_vgap=colon_vgap, time_offset=0,
-                                        align="center")
+        blink = blink_colon and now.second % 2 == 1
+        layout = _time_layout(s, time_font, colon_vgap, "center", device.width, device.height)
+        with frame_canvas(device, frames) as draw:
+            _draw_time_fast(draw, *layout, time_font, blink)
             if seconds_bar:
                 draw_seconds_bar(draw, now, device.width, y=device.height - 1, dotted=seconds_bar_dots)
         return
@@ -343,64 +534,82 @@ def render_info_page(device, page: str, now: datetime, time_font, text_font, tim
     elif p == "uptime":
         txt = get_uptime_short() or "UP --"
     elif p == "date":
-        txt = format_en_date(now, with_year=bool(ticker_with_year))
+        txt = format_en_date(now, with_year=ticker_with_year)
     else:
         txt = "N/A"
 
-    w, _ = textsize(txt, font=text_font)
+    w, _ = _measure(txt, text_font)
     if w > device.width:
-        marquee_once_legacy(device, txt, font=text_font, speed=ticker_speed, gap=ticker_gap)
+        await marquee_once_legacy(device, frames, txt, font=text_font, speed=ticker_speed, gap=ticker_gap)
     else:
-        with canvas(device) as draw:
+        with frame_canvas(device, frames) as draw:
             draw_center_text(draw, device, txt, font=text_font)
 
 # ------------------ Visual add-ons ------------------
+def seconds_bar_filled(now_dt: datetime, width: int) -> int:
+    """Number of lit bar pixels for the current second (0..59)."""
+    frac = (now_dt.second + now_dt.microsecond / 1_000_000.0) / 60.0
+    return int(frac * width)
+
 def draw_seconds_bar(draw, now_dt: datetime, width: int, y: int, dotted: bool = False):
     """Bottom progress bar for current second (0..59)."""
-    frac = (now_dt.second + now_dt.microsecond / 1_000_000.0) / 60.0
-    filled = int(frac * width)
+    filled = seconds_bar_filled(now_dt, width)
+    if filled <= 0:
+        return
     if dotted:
-        for x in range(0, filled, 2):
-            draw.point((x, y), fill="white")
+        draw.point([(x, y) for x in range(0, filled, 2)], fill=WHITE)
     else:
-        for x in range(filled):
-            draw.point((x, y), fill="white")
+        draw.line((0, y, filled - 1, y), fill=WHITE)
+
+@functools.lru_cache(maxsize=8)
+def _sparkle_lut(density: float) -> tuple[int, ...]:
+    """Byte -> ink lookup table: random bytes below density*256 light up."""
+    threshold = int(max(0.0, min(1.0, density)) * 256)
+    return tuple(WHITE if v < threshold else 0 for v in range(256))
 
-def hour_sparkle(device, duration: float = 0.45, density: float = 0.15, fps: int = 20):
+def sparkle_mask(size: tuple[int, int], density: float, mode: str = "1"):
+    """Random on/off frame; noise generation and thresholding both run inside Pillow."""
+    noise = Image.frombytes("L", size, random.randbytes(size[0] * size[1]))
+    return noise.point(_sparkle_lut(density), mode)
+
+async def hour_sparkle(device, frames: asyncio.Queue, duration: float = 0.45,
+                       density: float = 0.15, fps: int = 20):
     """Short random sparkle animation across the whole display."""
     frame_dt = 1.0 / max(1, fps)
     t_end = time.monotonic() + max(0.05, duration)
     while time.monotonic() < t_end and not stop:
-        with canvas(device) as draw:
-            for x in range(device.width):
-                for y in range(device.height):
-                    if random.random() < density:
-                        draw.point((x, y), fill="white")
-        time.sleep(frame_dt)
-
-def minute_swipe(device, timestr: str, time_font,
-                 left_reserved: int, colon_vgap: int,
-                 temp_txt: str | None, swipe_px: int = 8, frame_delay: float = 0.03,
-                 time_align: str = "right"):
+        submit_frame(frames, sparkle_mask(device.size, density, device.mode))
+        await asyncio.sleep(frame_dt)
+
+async def minute_swipe(device, frames: asyncio.Queue, timestr: str, time_font,
+                       left_reserved: int, colon_vgap: int,
+                       temp_txt: str | None, swipe_px: int = 8, frame_delay: float = 0.03,
+                       time_align: str = "right"):
     """
     Slide-in animation for minute change: new time slides in from the right by 'swipe_px'.
     Temp widget stays static on the left.
     """
     swipe_px = max(1, swipe_px)
+
+    # Static temp background and the final time layer are rendered once
+    bg = Image.new(device.mode, device.size)
+    if temp_txt:
+        y0 = (device.height - 5) // 2
+        draw_small35(ImageDraw.Draw(bg), 0, y0, temp_txt, spacing=1)
+    time_img = Image.new(device.mode, device.size)
+    draw_time_with_custom_colon(ImageDraw.Draw(time_img), device, timestr, time_font, blink=False,
+                                left_reserved=left_reserved, gap=1,
+                                colon_w=1, colon_vgap=colon_vgap, time_offset=0,
+                                align=time_align)
+
     for dx in range(swipe_px, -1, -1):
         if stop:
             return
-        with canvas(device) as draw:
-            # draw temp (static)
-            if temp_txt:
-                y0 = (device.height - 5) // 2
-                draw_small35(draw, 0, y0, temp_txt, spacing=1)
-            # draw time with positive offset (shift to the right)
-            draw_time_with_custom_colon(draw, device, timestr, time_font, blink=False,
-                                        left_reserved=left_reserved, gap=1,
-                                        colon_w=1, colon_vgap=colon_vgap, time_offset=dx,
-                                        align=time_align)
-        time.sleep(frame_delay)
+        # time layer shifted right by dx; masked by itself so lit pixels OR onto the background
+        frame = bg.copy()
+        frame.paste(time_img, (dx, 0), time_img)
+        submit_frame(frames, frame)
+        await asyncio.sleep(frame_delay)
 
 # ------------------ Main ------------------
 def main():
@@ -420,7 +629,7 @@ def main():
 
     # --- Time / colon ---
     time_fmt    = os.getenv("LED_TIME_FMT", "%H:%M")
-    blink_colon = _env_int("LED_BLINK_COLON", 1)
+    blink_colon = _env_bool("LED_BLINK_COLON", 1)
     colon_vgap  = _env_int("LED_COLON_VGAP", 2)         # vertical gap between colon dots
     time_align  = os.getenv("LED_TIME_ALIGN", "right").strip().lower()
     if time_align not in ("right", "center"):
@@ -430,7 +639,7 @@ def main():
     ticker_every     = _env_float("LED_TICKER_EVERY", 60.0)
     ticker_speed     = _env_float("LED_TICKER_SPEED", 0.07)
     ticker_gap       = _env_int("LED_TICKER_GAP", 16)
-    ticker_with_year = _env_int("LED_TICKER_WITH_YEAR", 1)
+    ticker_with_year = _env_bool("LED_TICKER_WITH_YEAR", 1)
 
     # --- Info pages mode ---
     info_enable_default = 1 if os.getenv("LED_PROFILE_NAME", "").strip().lower() == "info" else 0
@@ -442,8 +651,8 @@ def main():
     info_rotate_sec = max(1.0, _env_float("LED_INFO_ROTATE_SEC", 6.0))
 
     # --- Temperature widget ---
-    show_temp   = _env_int("LED_DRAW_TEMP", 1)
-    show_unit_c = _env_int("LED_TEMP_SHOW_C", 1)
+    show_temp   = _env_bool("LED_DRAW_TEMP", 1)
+    show_unit_c = _env_bool("LED_TEMP_SHOW_C", 1)
 
     # --- Temperature cycle (CPU / outdoor) ---
     temp_cycle_enable = _env_bool("LED_TEMP_CYCLE_ENABLE", 0)
@@ -473,6 +682,7 @@ def main():
     night_brt  = _env_int("LED_BRIGHTNESS_NIGHT", 3)    # 0..255
     night_from = _parse_hhmm(os.getenv("LED_NIGHT_FROM", "22:30"), (22, 30))
     night_to   = _parse_hhmm(os.getenv("LED_NIGHT_TO",   "07:00"), (7, 0))
+    brt_schedule = brightness_schedule(day_brt, night_brt, night_from, night_to)
 
     # --- Visual toggles ---
     seconds_bar       = _env_bool("LED_SECONDS_BAR", 1)
@@ -502,20 +712,10 @@ def main():
 
     # Apply initial brightness based on current time
     def _apply_brightness(now: datetime):
-        target = night_brt if _in_window(now, night_from, night_to) else day_brt
+        target = brt_schedule[now.hour * 60 + now.minute]
         device.contrast(target)
         return target
 
-    current_brt = _apply_brightness(datetime.now())
-    last_minute_for_dim = -1
-
-    # Track last rendered minute for swipe
-    last_rendered_minute = None
-
-    # Info pages state
-    info_idx = 0
-    info_last_switch_ts = 0.0
-
     # Weather cache + worker
     weather_state = {"temp_c": None, "last_ok_ts": 0.0, "last_try_ts": 0.0, "error": None}
     weather_lock = threading.Lock()
@@ -547,7 +747,23 @@ def main():
     signal.signal(signal.SIGTERM, handle_signal)
     signal.signal(signal.SIGINT, handle_signal)
 
-    try:
+    async def render_loop(frames: asyncio.Queue):
+        current_brt = await device_io(_apply_brightness, datetime.now())
+        last_minute_for_dim = -1
+
+        # Track last rendered minute for swipe
+        last_rendered_minute = None
+
+        # Content key of the last static frame; unchanged key -> skip redraw + SPI flush
+        last_frame_key = None
+
+        # Rasterized temp + time for the current minute; frames only add blink and seconds bar
+        base_cache = {"key": None, "colon_on": None, "colon_off": None}
+
+        # Info pages state
+        info_idx = 0
+        info_last_switch_ts = 0.0
+
         last_ticker_ts = time.monotonic()
         while not stop:
             now = datetime.now()
@@ -555,15 +771,16 @@ def main():
             # Auto-dim check once per minute
             if auto_dim and now.minute != last_minute_for_dim:
                 last_minute_for_dim = now.minute
-                target = night_brt if _in_window(now, night_from, night_to) else day_brt
+                target = brt_schedule[now.hour * 60 + now.minute]
                 if target != current_brt:
-                    device.contrast(target)
+                    await device_io(device.contrast, target)
                     current_brt = target
 
             # Hour sparkle at exactly 00 seconds
             if sparkle_on_hour and now.minute == 0 and now.second == 0:
-                hour_sparkle(device, duration=sparkle_duration,
-                             density=sparkle_density, fps=sparkle_fps)
+                await hour_sparkle(device, frames, duration=sparkle_duration,
+                                   density=sparkle_density, fps=sparkle_fps)
+                last_frame_key = None
 
             # Dedicated info-pages mode (page carousel)
             if info_enable:
@@ -574,34 +791,37 @@ def main():
                     info_idx = (info_idx + 1) % len(info_pages)
                     info_last_switch_ts = now_ts
 
-                render_info_page(
+                await render_info_page(
                     device=device,
+                    frames=frames,
                     page=info_pages[info_idx],
                     now=now,
                     time_font=time_font,
                     text_font=ticker_font,
                     time_fmt=time_fmt,
-                    blink_colon=bool(blink_colon),
+                    blink_colon=blink_colon,
                     colon_vgap=colon_vgap,
-                    seconds_bar=bool(seconds_bar),
-                    seconds_bar_dots=bool(seconds_bar_dots),
+                    seconds_bar=seconds_bar,
+                    seconds_bar_dots=seconds_bar_dots,
                     temp_show_c=show_unit_c,
                     ticker_with_year=ticker_with_year,
                     ticker_speed=ticker_speed,
                     ticker_gap=ticker_gap,
                 )
-                time.sleep(0.2)
+                await sleep_to_next_tick()
                 continue
 
             # Ticker: scroll date periodically (skip if we are on the exact hour second 0 to avoid conflict)
             if time.monotonic() - last_ticker_ts >= ticker_every and not (now.minute == 0 and now.second == 0):
-                txt = format_en_date(now, with_year=bool(ticker_with_year))
-                marquee_once_legacy(device, txt, font=ticker_font, speed=ticker_speed, gap=ticker_gap)
+                txt = format_en_date(now, with_year=ticker_with_year)
+                await marquee_once_legacy(device, frames, txt, font=ticker_font,
+                                          speed=ticker_speed, gap=ticker_gap)
                 last_ticker_ts = time.monotonic()
+                last_frame_key = None
 
             # Build current time string
             s = now.strftime(time_fmt)
-            blink = bool(blink_colon and (now.second % 2 == 1))
+            blink = blink_colon and now.second % 2 == 1
 
             # Prepare temperature text and left reservation budget
             # (We precompute widths to keep time stable)
@@ -609,8 +829,8 @@ def main():
                 hh, mm = s.split(":")
             except ValueError:
                 hh, mm = s[:2], s[-2:]
-            w_h, h = textsize(hh, font=time_font)
-            w_m, _ = textsize(mm, font=time_font)
+            w_h, h = _measure(hh, time_font)
+            w_m, _ = _measure(mm, time_font)
             w_time = w_h + 1 + 1 + 1 + w_m  # gap=1, colon_w=1, gap=1
             left_alloc_max = max(0, device.width - w_time)
 
@@ -653,31 +873,41 @@ def main():
             # Minute-change swipe (when minute changed since last render)
             if minute_swipe_en and (last_rendered_minute is None or now.minute != last_rendered_minute):
                 # Run swipe with the NEW minute value
-                minute_swipe(device, s, time_font,
-                             left_reserved=left_reserved, colon_vgap=colon_vgap,
-                             temp_txt=temp_txt, swipe_px=minute_swipe_px, frame_delay=minute_swipe_dt,
-                             time_align=time_align)
+                await minute_swipe(device, frames, s, time_font,
+                                   left_reserved=left_reserved, colon_vgap=colon_vgap,
+                                   temp_txt=temp_txt, swipe_px=minute_swipe_px, frame_delay=minute_swipe_dt,
+                                   time_align=time_align)
                 last_rendered_minute = now.minute
+                last_frame_key = None
                 # After swipe, draw one static frame this iteration (fall-through)
 
-            # Normal frame
-            with canvas(device) as draw:
-                # Temperature widget (left)
-                if temp_txt:
-                    y0 = (device.height - 5) // 2
-                    draw_small35(draw, 0, y0, temp_txt, spacing=1)
+            # Normal frame (only when something visible changed)
+            filled = seconds_bar_filled(now, device.width) if seconds_bar else -1
+            frame_key = (temp_txt, s, blink, left_reserved, filled)
+            if frame_key == last_frame_key:
+                await sleep_to_next_change(device.width, seconds_bar)
+                continue
+
+            # Temperature (left) + time (right), rebuilt only when their content changes
+            base_key = (temp_txt, s)
+            if base_key != base_cache["key"]:
+                base_cache["colon_on"], base_cache["colon_off"] = render_clock_base(
+                    device, s, time_font, temp_txt, colon_vgap=colon_vgap, align=time_align)
+                base_cache["key"] = base_key
 
-                # Time (right)
-                draw_time_with_custom_colon(draw, device, s, time_font, blink=blink,
-                                            left_reserved=left_reserved, gap=1,
-                                            colon_w=1, colon_vgap=colon_vgap, time_offset=0,
-                                            align=time_align)
+            # Seconds bar at the bottom row; with nothing to add the cached base is queued as-is
+            frame = base_cache["colon_off" if blink else "colon_on"]
+            if filled > 0:
+                frame = frame.copy()
+                draw_seconds_bar(ImageDraw.Draw(frame), now, device.width, y=device.height - 1,
+                                 dotted=seconds_bar_dots)
+            submit_frame(frames, frame)
+            last_frame_key = frame_key
 
-                # Seconds bar at the bottom row
-                if seconds_bar:
-                    draw_seconds_bar(draw, now, device.width, y=device.height - 1, dotted=seconds_bar_dots)
+            await sleep_to_next_change(device.width, seconds_bar)
 
-            time.sleep(0.2)
+    try:
+        asyncio.run(run_display(device, render_loop))
     finally:
         device.clear()
 